@@ -0,0 +1,6 @@
+"""
+NAD AV integration benchmarks and load tests.
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
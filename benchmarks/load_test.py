@@ -0,0 +1,233 @@
+"""
+Load test running many simulated NAD receivers against one integration process.
+
+The receivers run in a separate process, so loop lag, latency, memory and
+open file descriptors only reflect the integration side.
+
+Usage: python -m benchmarks.load_test --devices 10 50 100 --duration 15
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+from ucapi_framework import BaseConfigManager
+
+from intg_nadav.config import NADDeviceConfig
+from intg_nadav.device import NADDevice
+from intg_nadav.driver import NADDriver
+
+_LOG = logging.getLogger(__name__)
+
+SOURCES = {1: "Source 1", 2: "Source 2", 3: "Source 3"}
+
+
+@dataclass
+class LoadResult:
+    """Measurements for one load level."""
+
+    devices: int
+    loop_lag: list[float] = field(default_factory=list)
+    latency: list[float] = field(default_factory=list)
+    failures: int = 0
+    memory_per_device: float = 0.0
+    open_fds: int | None = None
+    threads: int = 0
+
+
+def _percentile(values: list[float], pct: int) -> float:
+    """Return the given percentile of values, 0 when empty."""
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def _open_fds() -> int | None:
+    """Return number of open file descriptors, if the platform exposes them."""
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return None
+
+
+def _raise_fd_limit() -> None:
+    """Raise the soft file descriptor limit to the hard limit."""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+async def _sample_loop_lag(result: LoadResult, stop: asyncio.Event, interval: float) -> None:
+    """Record how late the event loop wakes up from a fixed sleep."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(interval)
+        result.loop_lag.append(max(0.0, loop.time() - start - interval))
+        result.threads = max(result.threads, threading.active_count())
+
+
+async def _drive_device(device: NADDevice, result: LoadResult, stop: asyncio.Event) -> None:
+    """Send a random mix of commands and polls to one device."""
+    actions = (
+        device.volume_up,
+        device.volume_down,
+        lambda: device.set_volume(random.randint(10, 60)),
+        lambda: device.mute(not device.muted),
+        lambda: device.select_source(random.choice(list(SOURCES.values()))),
+        device._update_state,
+        device._update_state,
+    )
+    while not stop.is_set():
+        start = time.perf_counter()
+        ok = await random.choice(actions)()
+        result.latency.append(time.perf_counter() - start)
+        if ok is False:
+            result.failures += 1
+        await asyncio.sleep(random.uniform(0.2, 1.0))
+
+
+@asynccontextmanager
+async def _simulators(count: int) -> AsyncIterator[list[int]]:
+    """Run count simulated receivers in a child process and yield their ports."""
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "benchmarks.simulator", "--count", str(count),
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    try:
+        yield json.loads(await process.stdout.readline())
+    finally:
+        process.stdin.close()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=10)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+
+
+def _device_config(index: int, port: int) -> NADDeviceConfig:
+    """Return a Telnet config for a simulated receiver."""
+    return NADDeviceConfig(
+        identifier=f"127.0.0.1_{port}",
+        name=f"Sim {index}",
+        connection_type="Telnet",
+        host="127.0.0.1",
+        port=port,
+        sources=dict(SOURCES),
+    )
+
+
+async def _warm_up(driver: NADDriver, port: int) -> None:
+    """Exercise one device end to end so lazy imports and caches are not measured."""
+    config = _device_config(-1, port)
+    driver.config_manager.add_or_update(config)
+    device = driver.get_device(config.identifier)
+    await device.connect()
+    await device.volume_up()
+    await device.disconnect()
+    driver.config_manager.remove(config.identifier)
+
+
+async def run_load(devices: int, duration: float, lag_interval: float = 0.05) -> LoadResult:
+    """Start simulated receivers, register them with the driver and drive traffic."""
+    result = LoadResult(devices=devices)
+    loop = asyncio.get_running_loop()
+
+    async with _simulators(devices + 1) as ports:
+        with tempfile.TemporaryDirectory() as config_path:
+            driver = NADDriver(loop)
+            driver.config_manager = BaseConfigManager(
+                config_path,
+                add_handler=driver.on_device_added,
+                remove_handler=driver.on_device_removed,
+                config_class=NADDeviceConfig,
+            )
+            await _warm_up(driver, ports[0])
+
+            gc.collect()
+            tracemalloc.start()
+            baseline, _ = tracemalloc.get_traced_memory()
+
+            nad_devices: list[NADDevice] = []
+            for index, port in enumerate(ports[1:]):
+                config = _device_config(index, port)
+                driver.config_manager.add_or_update(config)
+                nad_devices.append(driver.get_device(config.identifier))
+            await asyncio.gather(*(device.connect() for device in nad_devices))
+
+            gc.collect()
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            result.memory_per_device = (current - baseline) / max(devices, 1)
+
+            stop = asyncio.Event()
+            sampler = asyncio.create_task(_sample_loop_lag(result, stop, lag_interval))
+            drivers = [asyncio.create_task(_drive_device(d, result, stop)) for d in nad_devices]
+
+            await asyncio.sleep(duration)
+            result.open_fds = _open_fds()
+
+            stop.set()
+            await asyncio.gather(sampler, *drivers, return_exceptions=True)
+            await asyncio.gather(*(device.disconnect() for device in nad_devices))
+
+    return result
+
+
+def _report(result: LoadResult) -> str:
+    """Format one result row."""
+    lag_ms = [lag * 1000 for lag in result.loop_lag]
+    latency_ms = [latency * 1000 for latency in result.latency]
+    return (
+        f"{result.devices:>7} | "
+        f"{_percentile(lag_ms, 50):>7.1f} {_percentile(lag_ms, 99):>7.1f} {max(lag_ms, default=0):>7.1f} | "
+        f"{_percentile(latency_ms, 50):>7.0f} {_percentile(latency_ms, 95):>7.0f} "
+        f"{_percentile(latency_ms, 99):>7.0f} | "
+        f"{len(result.latency):>6} {result.failures:>5} | "
+        f"{result.memory_per_device / 1024:>8.1f} | "
+        f"{result.open_fds if result.open_fds is not None else '-':>5} {result.threads:>8}"
+    )
+
+
+async def main(device_counts: list[int], duration: float) -> None:
+    """Run the load test for each device count and print a summary table."""
+    _raise_fd_limit()
+    print(
+        "devices | lag p50 lag p99 lag max | cmd p50 cmd p95 cmd p99 | "
+        "  cmds  fail | KiB/dev  |   fds peak thr"
+    )
+    print("        |   (ms)    (ms)    (ms)  |   (ms)    (ms)    (ms)  |")
+    for devices in device_counts:
+        result = await run_load(devices, duration)
+        print(_report(result), flush=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--devices", type=int, nargs="+", default=[10, 50, 100, 200])
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level, force=True)
+    for name in ("ucapi.api", "ucapi.entities", "ucapi.entity"):
+        logging.getLogger(name).setLevel(args.log_level)
+    asyncio.run(main(args.devices, args.duration))
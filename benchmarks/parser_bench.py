@@ -0,0 +1,84 @@
+"""
+Microbenchmarks for the NAD reply parser.
+
+Usage: python -m benchmarks.parser_bench --number 200000
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import argparse
+import timeit
+
+from intg_nadav.protocol import NADParser
+from intg_nadav.state import NADState
+
+MIN_DB = -92
+MAX_DB = -20
+SOURCES = {number: f"Source {number}" for number in range(1, 13)}
+
+
+def _legacy_reply(msg: str) -> str | None:
+    """Reply handling as done by nad_receiver.NADReceiver.exec_command."""
+    try:
+        return msg.split("=")[1]
+    except IndexError:
+        return None
+
+
+def _legacy_power(state: NADState, msg: str) -> None:
+    state.power = _legacy_reply(msg) == "On"
+
+
+def _legacy_volume(state: NADState, msg: str) -> None:
+    volume_db = float(_legacy_reply(msg))
+    state.volume = int(((volume_db - MIN_DB) / (MAX_DB - MIN_DB)) * 100)
+
+
+def _legacy_source(state: NADState, msg: str) -> None:
+    state.source = SOURCES.get(int(_legacy_reply(msg)))
+
+
+def _legacy_source_number(name: str) -> int | None:
+    for number, source in SOURCES.items():
+        if source == name:
+            return number
+    return None
+
+
+def main(number: int) -> None:
+    """Time legacy string handling against NADParser for common replies."""
+    state = NADState()
+    parser = NADParser(state, MIN_DB, MAX_DB, SOURCES)
+
+    cases = [
+        ("Main.Power=On",
+         lambda: _legacy_power(state, "Main.Power=On"),
+         lambda: parser.feed("Main.Power=On")),
+        ("Main.Volume=-48.5",
+         lambda: _legacy_volume(state, "Main.Volume=-48.5"),
+         lambda: parser.feed("Main.Volume=-48.5")),
+        ("Main.Source=11",
+         lambda: _legacy_source(state, "Main.Source=11"),
+         lambda: parser.feed("Main.Source=11")),
+        ("source name -> number (12 sources)",
+         lambda: _legacy_source_number("Source 12"),
+         lambda: parser.source_number("Source 12")),
+        ("unknown line",
+         lambda: _legacy_reply("Main.Model"),
+         lambda: parser.feed("Main.Model")),
+    ]
+
+    print(f"{'case':<36} {'legacy ns':>10} {'parser ns':>10} {'speedup':>8}")
+    for label, legacy, fast in cases:
+        legacy_ns = min(timeit.repeat(legacy, number=number, repeat=5)) / number * 1e9
+        fast_ns = min(timeit.repeat(fast, number=number, repeat=5)) / number * 1e9
+        print(f"{label:<36} {legacy_ns:>10.0f} {fast_ns:>10.0f} {legacy_ns / fast_ns:>7.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=200_000)
+    args = parser.parse_args()
+
+    main(args.number)
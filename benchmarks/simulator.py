@@ -0,0 +1,135 @@
+"""
+Simulated NAD receiver speaking the Telnet line protocol.
+
+Usage: python -m benchmarks.simulator --count 100
+
+Run as a module it starts the requested number of receivers in their own
+process, prints their ports as one JSON line and serves until stdin closes.
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+
+_LOG = logging.getLogger(__name__)
+
+
+class SimulatedReceiver:
+    """In-process NAD receiver answering Main.* queries and commands."""
+
+    def __init__(self, model: str = "T787"):
+        """Initialize simulated receiver."""
+        self.model = model
+        self.power = True
+        self.mute = False
+        self.volume = -40.0
+        self.source = 1
+        self.commands = 0
+        self._server: asyncio.AbstractServer | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    @property
+    def port(self) -> int:
+        """Return listening port."""
+        if self._server is None:
+            raise RuntimeError("Receiver not started")
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start listening and return the bound port."""
+        self._server = await asyncio.start_server(self._handle_client, host, port)
+        return self.port
+
+    async def stop(self) -> None:
+        """Stop listening and close client connections."""
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one Telnet client until it disconnects."""
+        self._writers.add(writer)
+        writer.write(f"\rMain.Model={self.model}\r\n".encode())
+        try:
+            while True:
+                data = await reader.readuntil(b"\r")
+                line = data.strip().decode()
+                if not line:
+                    continue
+                writer.write(f"\n{self.handle_line(line)}\r".encode())
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    def handle_line(self, line: str) -> str:
+        """Apply one NAD command line and return the reply line."""
+        self.commands += 1
+
+        for operator in ("?", "=", "+", "-"):
+            key, sep, value = line.partition(operator)
+            if sep:
+                break
+        else:
+            return line
+
+        if key == "Main.Power":
+            if operator == "=":
+                self.power = value == "On"
+            return f"{key}={'On' if self.power else 'Off'}"
+
+        if key == "Main.Mute":
+            if operator == "=":
+                self.mute = value == "On"
+            return f"{key}={'On' if self.mute else 'Off'}"
+
+        if key == "Main.Volume":
+            if operator == "=":
+                self.volume = float(value)
+            elif operator == "+":
+                self.volume = min(self.volume + 1, 12.0)
+            elif operator == "-":
+                self.volume = max(self.volume - 1, -99.0)
+            return f"{key}={self.volume:g}"
+
+        if key == "Main.Source":
+            if operator == "=":
+                self.source = int(value)
+            return f"{key}={self.source}"
+
+        if key == "Main.Model":
+            return f"{key}={self.model}"
+
+        return f"{key}="
+
+
+async def serve(count: int) -> None:
+    """Serve count receivers until stdin is closed by the parent process."""
+    receivers = [SimulatedReceiver() for _ in range(count)]
+    ports = [await receiver.start() for receiver in receivers]
+    print(json.dumps(ports), flush=True)
+
+    await asyncio.to_thread(sys.stdin.read)
+
+    for receiver in receivers:
+        await receiver.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1)
+    args = parser.parse_args()
+
+    asyncio.run(serve(args.count))
@@ -0,0 +1,108 @@
+"""
+Allocation benchmark for the per-device state record and update payload.
+
+Usage: python -m benchmarks.state_alloc --updates 100000
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import argparse
+import asyncio
+import gc
+import tracemalloc
+from typing import Any, Callable
+
+from intg_nadav.config import NADDeviceConfig
+from intg_nadav.device import NADDevice
+from intg_nadav.state import NADState
+
+
+class _LooseState:
+    """Attribute-dict state as kept by NADDevice before NADState."""
+
+    def __init__(self):
+        self.power = False
+        self.volume = 0
+        self.muted = False
+        self.source = None
+
+
+def _allocated(func: Callable[[], Any], repeat: int) -> float:
+    """
+    Return bytes allocated per call.
+
+    The results are held only long enough to be counted and are then
+    released, as the update handler does once it has applied a payload.
+    """
+    func()
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    results = [func() for _ in range(repeat)]
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+
+    # The list holding the results is not part of an update
+    return (held - baseline) / repeat - 8
+
+
+def _retained(factory: Callable[[], Any], count: int) -> float:
+    """Return bytes held per object when count objects are alive."""
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    objects = [factory() for _ in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return (current - baseline) / count
+
+
+def main(updates: int, devices: int) -> None:
+    """Compare loose attributes and per-access log_id against NADState."""
+    config = NADDeviceConfig(identifier="bench", name="Bench", connection_type="Telnet")
+
+    async def create_device() -> NADDevice:
+        return NADDevice(config, loop=asyncio.get_running_loop())
+
+    device = asyncio.run(create_device())
+    loose = _LooseState()
+
+    def legacy_update() -> tuple[str, dict]:
+        loose.volume = (loose.volume + 1) % 100
+        return f"[{config.name}]", {
+            "state": "ON" if loose.power else "OFF",
+            "volume": loose.volume,
+            "muted": loose.muted,
+            "source": loose.source,
+        }
+
+    def compact_update() -> tuple[str, dict]:
+        device._status.volume = (device._status.volume + 1) % 100
+        return device.log_id, device._status.payload()
+
+    print(f"{'update (log_id + payload)':<40} {'B/update':>9}")
+    for label, update in (
+        ("loose attributes + f-string log_id", legacy_update),
+        ("NADState + cached log_id", compact_update),
+    ):
+        print(f"{label:<40} {_allocated(update, updates):>9.0f}")
+
+    print()
+    print(f"{'state record':<40} {'B/device':>9}")
+    for label, factory in (
+        ("loose attributes", _LooseState),
+        ("NADState", NADState),
+    ):
+        print(f"{label:<40} {_retained(factory, devices):>9.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--updates", type=int, default=100_000)
+    parser.add_argument("--devices", type=int, default=1_000)
+    args = parser.parse_args()
+
+    main(args.updates, args.devices)
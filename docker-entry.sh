@@ -8,5 +8,5 @@ if [ -f requirements.txt ]; then
     pip install --no-cache-dir -q -r requirements.txt
 fi
 
-# Run integration as module
-python3 -u -m intg_nadav
\ No newline at end of file
+# Run integration as module, replacing the shell so it receives signals
+exec python3 -u -m intg_nadav
\ No newline at end of file
@@ -7,6 +7,7 @@ NAD AV integration for Unfolded Circle Remote.
 
 import asyncio
 import logging
+import math
 import os
 
 from ucapi import DeviceStates
@@ -14,6 +15,8 @@ from ucapi_framework import BaseConfigManager, get_config_path
 
 from intg_nadav.config import NADDeviceConfig
 from intg_nadav.driver import NADDriver
+from intg_nadav.loop_monitor import LoopMonitor
+from intg_nadav.profiling import Profiler
 from intg_nadav.setup_flow import NADSetupFlow
 
 __version__ = "1.0.4"
@@ -21,6 +24,36 @@ __version__ = "1.0.4"
 _LOG = logging.getLogger(__name__)
 
 
+def _env_float(name: str, default: float) -> float:
+    """Read a positive number from the environment, falling back to default."""
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        value = math.nan
+    if not math.isfinite(value) or value <= 0:
+        _LOG.warning("Invalid %s=%r, using default %s", name, raw, default)
+        return default
+    return value
+
+
+def _env_port(name: str) -> int | None:
+    """Read an optional TCP port from the environment, disabling it if invalid."""
+    raw = os.getenv(name, "")
+    if raw in ("", "0"):
+        return None
+    try:
+        port = int(raw)
+    except ValueError:
+        port = 0
+    if not 0 < port < 65536:
+        _LOG.warning("Invalid %s=%r, HTTP endpoint disabled", name, raw)
+        return None
+    return port
+
+
 async def main():
     """Main entry point for NAD integration."""
     logging.basicConfig(
@@ -35,11 +68,27 @@ async def main():
     try:
         loop = asyncio.get_running_loop()
         
+        loop_monitor = None
+        if os.getenv("UC_LOOP_MONITOR", "").lower() in ("1", "true", "yes"):
+            loop_monitor = LoopMonitor(
+                loop, threshold=_env_float("UC_LOOP_SLOW_MS", 100) / 1000
+            )
+            loop_monitor.start()
+        
         driver = NADDriver(loop)
         
         config_path = get_config_path(driver.api.config_dir_path or "")
         _LOG.info("Using configuration path: %s", config_path)
         
+        profiler = None
+        if os.getenv("UC_PROFILING", "").lower() in ("1", "true", "yes"):
+            profiler = Profiler(
+                loop,
+                os.path.join(config_path, "profiles"),
+                seconds=_env_float("UC_PROFILING_SECONDS", 10),
+            )
+            await profiler.start(port=_env_port("UC_PROFILING_PORT"))
+        
         driver.config_manager = BaseConfigManager(
             config_path,
             add_handler=driver.on_device_added,
@@ -23,6 +23,7 @@ class NADDeviceConfig:
     max_volume: int = -20
     volume_step: int = 4
     sources: dict[int, str] | None = None
+    command_profile: str | None = None
 
 
 class NADConfigManager(BaseConfigManager[NADDeviceConfig]):
@@ -10,6 +10,10 @@ import logging
 from typing import Any
 from ucapi_framework import ExternalClientDevice, DeviceEvents
 from intg_nadav.config import NADDeviceConfig
+from intg_nadav.protocol import NADParser
+from intg_nadav.rate_limit import CommandPacer, get_command_profile
+from intg_nadav.state import NADState
+from intg_nadav.validator import take_validated_client
 
 _LOG = logging.getLogger(__name__)
 
@@ -17,7 +21,7 @@ _LOG = logging.getLogger(__name__)
 class NADDevice(ExternalClientDevice):
     """NAD AV receiver/amplifier using ExternalClientDevice pattern."""
     
-    def __init__(self, device_config: NADDeviceConfig, loop=None, config_manager=None):
+    def __init__(self, device_config: NADDeviceConfig, loop=None, config_manager=None, **kwargs):
         """Initialize NAD device."""
         super().__init__(
             device_config,
@@ -27,17 +31,26 @@ class NADDevice(ExternalClientDevice):
             reconnect_delay=5,
             max_reconnect_attempts=3,
             config_manager=config_manager,
+            **kwargs,
         )
         
-        self._power = False
-        self._volume = 0
-        self._muted = False
-        self._source = None
+        self._status = NADState()
+        self._parser = NADParser(
+            self._status,
+            device_config.min_volume,
+            device_config.max_volume,
+            device_config.sources,
+        )
         self._source_list = []
+        self._log_id = f"[{device_config.name}]"
         
         self._min_vol_nad = (device_config.min_volume + 90) * 2
         self._max_vol_nad = (device_config.max_volume + 90) * 2
         self._volume_step = device_config.volume_step
+        
+        self._pacer = CommandPacer(
+            get_command_profile(device_config.connection_type, device_config.command_profile)
+        )
     
     @property
     def identifier(self) -> str:
@@ -57,27 +70,27 @@ class NADDevice(ExternalClientDevice):
     @property
     def log_id(self) -> str:
         """Return log identifier."""
-        return f"[{self.name}]"
+        return self._log_id
     
     @property
     def power(self) -> bool:
         """Return power state."""
-        return self._power
+        return self._status.power
     
     @property
     def volume(self) -> int:
         """Return volume level (0-100)."""
-        return self._volume
+        return self._status.volume
     
     @property
     def muted(self) -> bool:
         """Return mute state."""
-        return self._muted
+        return self._status.muted
     
     @property
     def source(self) -> str | None:
         """Return current source."""
-        return self._source
+        return self._status.source
     
     @property
     def source_list(self) -> list[str]:
@@ -88,6 +101,11 @@ class NADDevice(ExternalClientDevice):
         """Create NAD receiver client."""
         from nad_receiver import NADReceiverTCP, NADReceiverTelnet, NADReceiver
         
+        client = take_validated_client(self.identifier)
+        if client is not None:
+            _LOG.info("%s Reusing connection opened during setup", self.log_id)
+            return client
+        
         connection_type = self.device_config.connection_type
         
         if connection_type == "TCP":
@@ -152,11 +170,12 @@ class NADDevice(ExternalClientDevice):
         
         return self.check_client_connected()
     
-    async def _execute_command(self, command_func, *args, **kwargs):
+    async def _execute_command(self, command_func, *args, acknowledged=True, **kwargs):
         """
         Execute command with connection checking and retry logic.
         
-        Handles both connection issues and broken pipe errors.
+        Handles both connection issues and broken pipe errors. Pass
+        acknowledged=False for TCP commands that do not read a reply.
         """
         if not await self._ensure_connected():
             raise RuntimeError("Device not connected")
@@ -164,8 +183,9 @@ class NADDevice(ExternalClientDevice):
         max_retries = 2
         for attempt in range(max_retries):
             try:
-                result = await asyncio.to_thread(command_func, *args, **kwargs)
-                return result
+                return await self._pacer.run(
+                    command_func, *args, acknowledged=acknowledged, **kwargs
+                )
             except (OSError, BrokenPipeError, ConnectionError) as err:
                 if attempt < max_retries - 1:
                     _LOG.warning(
@@ -201,16 +221,7 @@ class NADDevice(ExternalClientDevice):
             else:
                 await self._update_serial_state()
             
-            self.events.emit(
-                DeviceEvents.UPDATE,
-                self.identifier,
-                {
-                    "state": "ON" if self._power else "OFF",
-                    "volume": self._volume,
-                    "muted": self._muted,
-                    "source": self._source,
-                }
-            )
+            self.events.emit(DeviceEvents.UPDATE, self.identifier, self._status.payload())
         except Exception as err:
             _LOG.error("%s State update failed: %s", self.log_id, err)
     
@@ -219,43 +230,39 @@ class NADDevice(ExternalClientDevice):
         try:
             status = await self._execute_command(self._client.status)
             if status:
-                self._power = status.get("power", False)
-                self._muted = status.get("muted", False)
-                self._source = status.get("source")
+                self._status.power = status.get("power", False)
+                self._status.muted = status.get("muted", False)
+                self._status.source = status.get("source")
                 
                 nad_volume = status.get("volume", 0)
                 if nad_volume < self._min_vol_nad:
-                    self._volume = 0
+                    self._status.volume = 0
                 elif nad_volume > self._max_vol_nad:
-                    self._volume = 100
+                    self._status.volume = 100
                 else:
                     volume_range = self._max_vol_nad - self._min_vol_nad
-                    self._volume = int(((nad_volume - self._min_vol_nad) / volume_range) * 100)
+                    self._status.volume = int(((nad_volume - self._min_vol_nad) / volume_range) * 100)
         except Exception as err:
             _LOG.error("%s TCP state update failed: %s", self.log_id, err)
     
     async def _update_serial_state(self) -> None:
         """Update state for RS232/Telnet connection."""
         try:
-            power_state = await self._execute_command(self._client.main_power, "?")
-            self._power = power_state == "On"
+            if not await self._query("Main.Power?"):
+                self._status.power = False
             
-            if self._power:
-                mute_state = await self._execute_command(self._client.main_mute, "?")
-                self._muted = mute_state == "On"
-                
-                volume_db = await self._execute_command(self._client.main_volume, "?")
-                if volume_db is not None:
-                    min_db = self.device_config.min_volume
-                    max_db = self.device_config.max_volume
-                    self._volume = int(((volume_db - min_db) / (max_db - min_db)) * 100)
-                
-                source_num = await self._execute_command(self._client.main_source, "?")
-                if self.device_config.sources and source_num:
-                    self._source = self.device_config.sources.get(source_num)
+            if self._status.power:
+                await self._query("Main.Mute?")
+                await self._query("Main.Volume?")
+                await self._query("Main.Source?")
         except Exception as err:
             _LOG.error("%s Serial state update failed: %s", self.log_id, err)
     
+    async def _query(self, command: str) -> bool:
+        """Send a raw RS232/Telnet query and apply the reply to device state."""
+        reply = await self._execute_command(self._client.transport.communicate, command)
+        return self._parser.feed(reply) if reply else False
+    
     async def turn_on(self) -> bool:
         """Turn device on."""
         try:
@@ -266,8 +273,7 @@ class NADDevice(ExternalClientDevice):
             else:
                 await self._execute_command(self._client.main_power, "=", "On")
             
-            self._power = True
-            await asyncio.sleep(0.5)
+            self._status.power = True
             await self._update_state()
             return True
         except Exception as err:
@@ -280,12 +286,11 @@ class NADDevice(ExternalClientDevice):
             _LOG.info("%s Turning off...", self.log_id)
             
             if self.device_config.connection_type == "TCP":
-                await self._execute_command(self._client.power_off)
+                await self._execute_command(self._client.power_off, acknowledged=False)
             else:
                 await self._execute_command(self._client.main_power, "=", "Off")
             
-            self._power = False
-            await asyncio.sleep(0.5)
+            self._status.power = False
             await self._update_state()
             return True
         except Exception as err:
@@ -300,15 +305,16 @@ class NADDevice(ExternalClientDevice):
             if self.device_config.connection_type == "TCP":
                 volume_range = self._max_vol_nad - self._min_vol_nad
                 nad_volume = int((volume / 100) * volume_range + self._min_vol_nad)
-                await self._execute_command(self._client.set_volume, nad_volume)
+                await self._execute_command(
+                    self._client.set_volume, nad_volume, acknowledged=False
+                )
             else:
                 min_db = self.device_config.min_volume
                 max_db = self.device_config.max_volume
                 volume_db = int((volume / 100) * (max_db - min_db) + min_db)
                 await self._execute_command(self._client.main_volume, "=", volume_db)
             
-            self._volume = volume
-            await asyncio.sleep(0.3)
+            self._status.volume = volume
             await self._update_state()
             return True
         except Exception as err:
@@ -321,15 +327,15 @@ class NADDevice(ExternalClientDevice):
             _LOG.info("%s Volume up", self.log_id)
             
             if self.device_config.connection_type == "TCP":
-                nad_volume = self._nad_volume_from_percent(self._volume)
+                nad_volume = self._nad_volume_from_percent(self._status.volume)
                 await self._execute_command(
                     self._client.set_volume, 
-                    nad_volume + 2 * self._volume_step
+                    nad_volume + 2 * self._volume_step,
+                    acknowledged=False,
                 )
             else:
                 await self._execute_command(self._client.main_volume, "+")
             
-            await asyncio.sleep(0.3)
             await self._update_state()
             return True
         except Exception as err:
@@ -342,15 +348,15 @@ class NADDevice(ExternalClientDevice):
             _LOG.info("%s Volume down", self.log_id)
             
             if self.device_config.connection_type == "TCP":
-                nad_volume = self._nad_volume_from_percent(self._volume)
+                nad_volume = self._nad_volume_from_percent(self._status.volume)
                 await self._execute_command(
                     self._client.set_volume, 
-                    nad_volume - 2 * self._volume_step
+                    nad_volume - 2 * self._volume_step,
+                    acknowledged=False,
                 )
             else:
                 await self._execute_command(self._client.main_volume, "-")
             
-            await asyncio.sleep(0.3)
             await self._update_state()
             return True
         except Exception as err:
@@ -366,13 +372,12 @@ class NADDevice(ExternalClientDevice):
                 if mute:
                     await self._execute_command(self._client.mute)
                 else:
-                    await self._execute_command(self._client.unmute)
+                    await self._execute_command(self._client.unmute, acknowledged=False)
             else:
                 state = "On" if mute else "Off"
                 await self._execute_command(self._client.main_mute, "=", state)
             
-            self._muted = mute
-            await asyncio.sleep(0.3)
+            self._status.muted = mute
             await self._update_state()
             return True
         except Exception as err:
@@ -387,21 +392,14 @@ class NADDevice(ExternalClientDevice):
             if self.device_config.connection_type == "TCP":
                 await self._execute_command(self._client.select_source, source)
             else:
-                source_num = None
-                if self.device_config.sources:
-                    for num, name in self.device_config.sources.items():
-                        if name == source:
-                            source_num = num
-                            break
-                
+                source_num = self._parser.source_number(source)
                 if source_num:
                     await self._execute_command(self._client.main_source, "=", source_num)
                 else:
                     _LOG.warning("%s Source not found: %s", self.log_id, source)
                     return False
             
-            self._source = source
-            await asyncio.sleep(0.5)
+            self._status.source = source
             await self._update_state()
             return True
         except Exception as err:
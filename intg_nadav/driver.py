@@ -27,4 +27,8 @@ class NADDriver(BaseIntegrationDriver[NADDevice, NADDeviceConfig]):
             device_class=NADDevice,
             entity_classes=NADMediaPlayer,
             driver_id="nadav",
-        )
\ No newline at end of file
+        )
+    
+    def get_device(self, device_id: str) -> NADDevice | None:
+        """Return the device instance for a device identifier."""
+        return self._device_instances.get(device_id)
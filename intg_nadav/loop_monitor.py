@@ -0,0 +1,146 @@
+"""
+Event loop health monitor for NAD AV integration.
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Any
+
+_LOG = logging.getLogger(__name__)
+
+
+class LoopMonitor:
+    """
+    Measure event loop lag and report callbacks that block the loop.
+
+    A heartbeat task on the loop records how late each wake-up is. A watchdog
+    thread checks the heartbeat and, when the loop has been stuck longer than
+    the threshold, logs the loop thread's current stack so the blocking code
+    can be identified. The full stall duration is logged once the heartbeat
+    resumes.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        interval: float = 0.25,
+        threshold: float = 0.1,
+        report_interval: float = 60.0,
+    ):
+        """Initialize loop monitor."""
+        self._loop = loop
+        self._interval = interval
+        self._threshold = threshold
+        self._report_interval = report_interval
+        self._loop_thread_id: int | None = None
+        self._beat = time.monotonic()
+        self._stall_reported = False
+        self._stop = threading.Event()
+        self._task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+
+        self._samples = 0
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+        self._slow_callbacks = 0
+        self._slowest = 0.0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return lag and slow callback figures for the current report window."""
+        return {
+            "samples": self._samples,
+            "lag_avg_ms": round(self._lag_total / self._samples * 1000, 2) if self._samples else 0.0,
+            "lag_max_ms": round(self._lag_max * 1000, 2),
+            "slow_callbacks": self._slow_callbacks,
+            "slowest_ms": round(self._slowest * 1000, 2),
+        }
+
+    def start(self) -> None:
+        """Start heartbeat task and watchdog thread. Must be called on the loop."""
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._task = self._loop.create_task(self._heartbeat())
+        self._thread = threading.Thread(
+            target=self._watchdog, name="loop-monitor", daemon=True
+        )
+        self._thread.start()
+        _LOG.info(
+            "Event loop monitor started (interval: %.0fms, threshold: %.0fms)",
+            self._interval * 1000, self._threshold * 1000
+        )
+
+    async def stop(self) -> None:
+        """Stop heartbeat task and watchdog thread."""
+        self._stop.set()
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        if self._thread:
+            await asyncio.to_thread(self._thread.join)
+            self._thread = None
+
+    def _reset(self) -> None:
+        """Start a new report window."""
+        self._samples = 0
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+        self._slow_callbacks = 0
+        self._slowest = 0.0
+
+    async def _heartbeat(self) -> None:
+        """Sleep for a fixed interval and record how late the loop wakes up."""
+        last_report = time.monotonic()
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self._interval)
+            now = time.monotonic()
+            lag = max(0.0, now - start - self._interval)
+
+            self._beat = now
+            stack_logged, self._stall_reported = self._stall_reported, False
+            self._samples += 1
+            self._lag_total += lag
+            if lag > self._lag_max:
+                self._lag_max = lag
+            if lag > self._threshold:
+                self._slow_callbacks += 1
+                self._slowest = max(self._slowest, lag)
+                _LOG.warning(
+                    "Event loop was blocked for %.0fms (threshold %.0fms)%s",
+                    lag * 1000, self._threshold * 1000,
+                    ", stack logged above" if stack_logged else ""
+                )
+
+            if now - last_report >= self._report_interval:
+                _LOG.info("Event loop health: %s", self.stats)
+                self._reset()
+                last_report = now
+
+    def _watchdog(self) -> None:
+        """Log the loop thread's stack when the heartbeat is overdue."""
+        deadline = self._interval + self._threshold
+        while not self._stop.wait(self._threshold / 2):
+            stalled = time.monotonic() - self._beat
+            if stalled <= deadline or self._stall_reported:
+                continue
+
+            self._stall_reported = True
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else "<unavailable>\n"
+            _LOG.warning(
+                "Event loop blocked for more than %.0fms (threshold %.0fms), loop thread stack:\n%s",
+                (stalled - self._interval) * 1000, self._threshold * 1000, stack
+            )
@@ -0,0 +1,232 @@
+"""
+On-demand profiling for NAD AV integration.
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import asyncio
+import cProfile
+import io
+import json
+import logging
+import math
+import os
+import pstats
+import signal
+import textwrap
+import time
+import weakref
+from datetime import datetime
+from urllib.parse import parse_qs, urlparse
+
+_LOG = logging.getLogger(__name__)
+
+DEFAULT_PROFILE_SECONDS = 10.0
+MAX_PROFILE_SECONDS = 120.0
+
+
+class Profiler:
+    """
+    Capture CPU profiles and asyncio task dumps from the running integration.
+
+    Captures are triggered with SIGUSR1 or through a small HTTP endpoint bound
+    to localhost, and written to the output directory for offline analysis:
+
+        GET /profile?seconds=10   CPU profile plus task dump
+        GET /tasks                task dump only
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        output_dir: str,
+        seconds: float = DEFAULT_PROFILE_SECONDS,
+    ):
+        """Initialize profiler."""
+        self._loop = loop
+        self._output_dir = output_dir
+        self._seconds = seconds
+        self._created: weakref.WeakKeyDictionary[asyncio.Task, float] = weakref.WeakKeyDictionary()
+        self._capture_lock = asyncio.Lock()
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self, port: int | None = None) -> None:
+        """Track task ages and install the signal handler and HTTP endpoint."""
+        factory = self._loop.get_task_factory()
+
+        def task_factory(loop, coro, **kwargs):
+            if factory is None:
+                task = asyncio.Task(coro, loop=loop, **kwargs)
+            else:
+                task = factory(loop, coro, **kwargs)
+            self._created[task] = time.monotonic()
+            return task
+
+        self._loop.set_task_factory(task_factory)
+
+        try:
+            self._loop.add_signal_handler(signal.SIGUSR1, self._on_signal)
+            _LOG.info("Profiling enabled: send SIGUSR1 to capture a %gs profile", self._seconds)
+        except (NotImplementedError, AttributeError):
+            _LOG.debug("Signal handlers not supported, SIGUSR1 trigger disabled")
+
+        if port:
+            self._server = await asyncio.start_server(self._handle_http, "127.0.0.1", port)
+            _LOG.info("Profiling endpoint listening on http://127.0.0.1:%d", port)
+
+    async def stop(self) -> None:
+        """Remove the signal handler and close the HTTP endpoint."""
+        try:
+            self._loop.remove_signal_handler(signal.SIGUSR1)
+        except (NotImplementedError, AttributeError):
+            pass
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def _on_signal(self) -> None:
+        """Start a capture in the background."""
+        self._loop.create_task(self._capture_from_signal())
+
+    async def _capture_from_signal(self) -> None:
+        """Run a signal-triggered capture, logging instead of raising."""
+        try:
+            await self.capture(self._seconds)
+        except Exception as err:
+            _LOG.warning("Profile capture failed: %s", err)
+
+    async def capture(self, seconds: float | None = None) -> list[str]:
+        """Write a task dump and a CPU profile, returning the written paths."""
+        if seconds is None:
+            seconds = self._seconds
+        if not math.isfinite(seconds) or seconds <= 0:
+            raise ValueError(f"Profile length must be a positive number of seconds, got {seconds}")
+        if self._capture_lock.locked():
+            raise RuntimeError("A profile capture is already running")
+
+        async with self._capture_lock:
+            seconds = min(seconds, MAX_PROFILE_SECONDS)
+            stamp = _stamp()
+            paths = [await self.write_task_dump(stamp)]
+
+            _LOG.info("Capturing CPU profile for %gs", seconds)
+            profile = cProfile.Profile()
+            profile.enable()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                profile.disable()
+
+            paths += await asyncio.to_thread(self._write_profile, profile, stamp)
+            _LOG.info("Profile written: %s", ", ".join(paths))
+            return paths
+
+    async def write_task_dump(self, stamp: str | None = None) -> str:
+        """Write all pending asyncio tasks to a text file and return its path."""
+        stamp = stamp or _stamp()
+        path = os.path.join(self._output_dir, f"tasks-{stamp}.txt")
+        dump = self.format_tasks()
+        await asyncio.to_thread(self._write_text, path, dump)
+        return path
+
+    def format_tasks(self) -> str:
+        """Return a description of every pending task, oldest first."""
+        now = time.monotonic()
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks(self._loop) if task is not current]
+        tasks.sort(key=lambda task: self._created.get(task, 0.0))
+
+        out = io.StringIO()
+        out.write(f"{len(tasks)} pending task(s)\n\n")
+        for task in tasks:
+            created = self._created.get(task)
+            age = f"{now - created:.1f}s" if created is not None else "unknown"
+            out.write(f"{task.get_name()}  age={age}\n")
+            out.write(f"  coroutine: {_qualname(task.get_coro())}\n")
+            out.write(f"  awaiting:  {' -> '.join(_await_chain(task.get_coro())) or '-'}\n")
+            stack = io.StringIO()
+            task.print_stack(limit=15, file=stack)
+            out.write(textwrap.indent(stack.getvalue(), "  "))
+            out.write("\n")
+        return out.getvalue()
+
+    def _write_profile(self, profile: cProfile.Profile, stamp: str) -> list[str]:
+        """Write binary pstats data and a readable summary."""
+        prof_path = os.path.join(self._output_dir, f"profile-{stamp}.prof")
+        profile.dump_stats(prof_path)
+
+        summary = io.StringIO()
+        stats = pstats.Stats(profile, stream=summary)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(50)
+        text_path = os.path.join(self._output_dir, f"profile-{stamp}.txt")
+        self._write_text(text_path, summary.getvalue())
+        return [prof_path, text_path]
+
+    @staticmethod
+    def _write_text(path: str, text: str) -> None:
+        """Write text to path, creating the directory if needed."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(text)
+
+    async def _handle_http(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve a single profiling request."""
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            while (await reader.readline()).strip():
+                pass
+
+            url = urlparse(request_line[1] if len(request_line) > 1 else "/")
+            if url.path == "/profile":
+                seconds = parse_qs(url.query).get("seconds")
+                status, body = 200, {
+                    "files": await self.capture(float(seconds[0]) if seconds else None)
+                }
+            elif url.path == "/tasks":
+                status, body = 200, {"files": [await self.write_task_dump()]}
+            else:
+                status, body = 404, {"error": "Use /profile?seconds=N or /tasks"}
+        except ValueError as err:
+            status, body = 400, {"error": str(err)}
+        except RuntimeError as err:
+            status, body = 409, {"error": str(err)}
+        except Exception as err:
+            _LOG.error("Profiling request failed: %s", err)
+            status, body = 500, {"error": str(err)}
+
+        payload = json.dumps(body).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: close\r\n\r\n".encode() + payload
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+
+def _stamp() -> str:
+    """Return a file name timestamp with millisecond resolution."""
+    return datetime.now().strftime("%Y%m%d-%H%M%S-%f")[:-3]
+
+
+def _qualname(coro) -> str:
+    """Return a readable name for a coroutine or awaitable."""
+    return getattr(coro, "__qualname__", None) or repr(coro)
+
+
+def _await_chain(coro) -> list[str]:
+    """Follow cr_await from a coroutine down to the innermost awaitable."""
+    chain = []
+    awaited = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    while awaited is not None and len(chain) < 20:
+        chain.append(_qualname(awaited) if hasattr(awaited, "__qualname__") else repr(awaited))
+        awaited = getattr(awaited, "cr_await", None) or getattr(awaited, "gi_yieldfrom", None)
+    return chain
@@ -0,0 +1,99 @@
+"""
+NAD AV protocol line parser for Unfolded Circle integration.
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+from typing import Any, Callable
+
+from intg_nadav.state import NADState
+
+# Bound on the response table once volume readings are memoised into it
+MAX_RESPONSES = 512
+
+
+class NADParser:
+    """
+    Apply NAD reply lines such as "Main.Power=On" to a device state.
+
+    Replies and unsolicited push lines share the same format. Lines with a
+    fixed set of values (power, mute, configured sources) are looked up whole
+    in a precompiled response table; the rest are dispatched on their
+    Domain.Attribute key. Volume readings repeat in fixed dB steps, so each
+    one parsed is added to the table.
+    """
+
+    __slots__ = ("_state", "_min_db", "_db_range", "_responses", "_source_numbers")
+
+    def __init__(
+        self,
+        state: NADState,
+        min_volume: int,
+        max_volume: int,
+        sources: dict[int, str] | None = None,
+    ):
+        """Initialize NAD parser."""
+        self._state = state
+        self._min_db = float(min_volume)
+        self._db_range = float(max_volume - min_volume)
+        self._responses: dict[str, tuple[str, Any]] = {
+            "Main.Power=On": ("power", True),
+            "Main.Power=Off": ("power", False),
+            "Main.Mute=On": ("muted", True),
+            "Main.Mute=Off": ("muted", False),
+        }
+        self._source_numbers: dict[str, int] = {}
+        for number, name in (sources or {}).items():
+            # Keys are strings once the config has round-tripped through JSON
+            self._responses[f"Main.Source={int(number)}"] = ("source", name)
+            self._source_numbers[name] = int(number)
+
+    def source_number(self, name: str) -> int | None:
+        """Return the input number for a source name."""
+        return self._source_numbers.get(name)
+
+    def feed(self, line: str) -> bool:
+        """Apply one reply line, returning False if it was not recognised."""
+        response = self._responses.get(line)
+        if response is None:
+            line = line.strip()
+            response = self._responses.get(line)
+        if response is not None:
+            setattr(self._state, response[0], response[1])
+            return True
+
+        key, sep, value = line.partition("=")
+        handler = _DISPATCH.get(key) if sep else None
+        return handler(self, value) if handler is not None else False
+
+    def _on_switch(self, attribute: str, value: str) -> bool:
+        """Set an On/Off attribute."""
+        setattr(self._state, attribute, value == "On")
+        return True
+
+    def _on_volume(self, value: str) -> bool:
+        """Convert a dB reading to a 0-100 volume, ignoring malformed values."""
+        try:
+            volume_db = float(value)
+        except ValueError:
+            return False
+        percent = int((volume_db - self._min_db) / self._db_range * 100)
+        volume = 0 if percent < 0 else 100 if percent > 100 else percent
+        self._state.volume = volume
+        if len(self._responses) < MAX_RESPONSES:
+            self._responses["Main.Volume=" + value] = ("volume", volume)
+        return True
+
+    def _on_source(self, value: str) -> bool:
+        """Clear the source for an input that is not configured."""
+        self._state.source = None
+        return True
+
+
+_DISPATCH: dict[str, Callable[[NADParser, str], bool]] = {
+    "Main.Power": lambda parser, value: parser._on_switch("power", value),
+    "Main.Mute": lambda parser, value: parser._on_switch("muted", value),
+    "Main.Volume": NADParser._on_volume,
+    "Main.Source": NADParser._on_source,
+}
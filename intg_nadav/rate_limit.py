@@ -0,0 +1,152 @@
+"""
+NAD AV command pacing for Unfolded Circle integration.
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, TypeVar
+
+_LOG = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CommandProfile:
+    """Command pacing limits for a family of NAD receivers."""
+
+    rate: float
+    burst: int
+    settle: float
+    # Pause after a command that returns without waiting for the receiver's reply
+    write_settle: float = 0.0
+
+
+COMMAND_PROFILES: dict[str, CommandProfile] = {
+    # D/M series digital amplifiers - TCP, one socket per command; volume, unmute
+    # and power off are not acknowledged and the D 7050 hangs if rushed after them
+    "digital": CommandProfile(rate=20.0, burst=8, settle=0.0, write_settle=0.3),
+    # Telnet and RS-232 receivers - a command plus its state refresh fits in one burst
+    "network": CommandProfile(rate=15.0, burst=6, settle=0.02),
+    # Older firmware that garbles back-to-back commands
+    "classic": CommandProfile(rate=5.0, burst=5, settle=0.1),
+}
+
+DEFAULT_PROFILES: dict[str, str] = {
+    "TCP": "digital",
+    "Telnet": "network",
+    "RS232": "network",
+}
+
+
+def get_command_profile(connection_type: str, name: str | None = None) -> CommandProfile:
+    """Return the named profile, falling back to the connection type default."""
+    if name and name in COMMAND_PROFILES:
+        return COMMAND_PROFILES[name]
+
+    if name:
+        _LOG.warning("Unknown command profile '%s', using default for %s", name, connection_type)
+
+    return COMMAND_PROFILES[DEFAULT_PROFILES.get(connection_type, "classic")]
+
+
+class TokenBucket:
+    """Token bucket allowing short bursts while enforcing an average rate."""
+
+    def __init__(self, rate: float, burst: int):
+        """Initialize token bucket."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        self._refill()
+        while self._tokens < 1:
+            await asyncio.sleep((1 - self._tokens) / self._rate)
+            self._refill()
+        self._tokens -= 1
+
+
+class CommandPacer:
+    """
+    Per-device flow control for NAD commands.
+
+    Commands are serialized so the next one is only written once the previous
+    one has returned, then held back by the profile's settle time and token
+    bucket so bursts never exceed what the receiver firmware can handle.
+    Commands that return without reading a reply are followed by the longer
+    write settle time instead, since the receiver may still be applying them.
+    """
+
+    def __init__(self, profile: CommandProfile):
+        """Initialize command pacer."""
+        self._profile = profile
+        self._bucket = TokenBucket(profile.rate, profile.burst)
+        self._lock = asyncio.Lock()
+        self._ready_at = 0.0
+
+    @property
+    def profile(self) -> CommandProfile:
+        """Return active command profile."""
+        return self._profile
+
+    @asynccontextmanager
+    async def slot(self, acknowledged: bool = True) -> AsyncIterator[None]:
+        """Hold the command channel for one request/reply exchange."""
+        async with self._lock:
+            # Tokens keep refilling during the settle time, so the two waits overlap
+            remaining = self._ready_at - time.monotonic()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+
+            await self._bucket.acquire()
+            try:
+                yield
+            finally:
+                settle = self._profile.settle
+                if not acknowledged:
+                    settle = max(settle, self._profile.write_settle)
+                self._ready_at = time.monotonic() + settle
+
+    async def run(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        acknowledged: bool = True,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Run a blocking client call in a worker thread within one slot.
+
+        Pass acknowledged=False for calls that return as soon as the command
+        is written. If the caller is cancelled, the slot is held until the
+        worker thread has finished with the transport so the next command
+        cannot overlap it.
+        """
+        async with self.slot(acknowledged):
+            future = asyncio.ensure_future(asyncio.to_thread(func, *args, **kwargs))
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                while not future.done():
+                    try:
+                        await asyncio.wait({future})
+                    except asyncio.CancelledError:
+                        pass
+                if not future.cancelled():
+                    future.exception()
+                raise
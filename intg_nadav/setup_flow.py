@@ -10,6 +10,7 @@ from typing import Any
 from ucapi import RequestUserInput, IntegrationSetupError, SetupError
 from ucapi_framework import BaseSetupFlow
 from intg_nadav.config import NADDeviceConfig
+from intg_nadav.validator import ConnectionValidator, store_validated_client
 
 _LOG = logging.getLogger(__name__)
 
@@ -24,8 +25,9 @@ class NADSetupFlow(BaseSetupFlow[NADDeviceConfig]):
         host = input_values.get("host", "").strip()
         port = int(input_values.get("port", 53))
         serial_port = input_values.get("serial_port", "/dev/ttyUSB0").strip()
+        command_profile = input_values.get("command_profile", "auto")
         
-        if connection_type in ("TCP", "Telnet"):
+        if connection_type in ("TCP", "Telnet", "Auto"):
             if not host:
                 _LOG.warning("Host required for TCP/Telnet connection")
                 return SetupError(error_type=IntegrationSetupError.CONNECTION_REFUSED)
@@ -38,15 +40,28 @@ class NADSetupFlow(BaseSetupFlow[NADDeviceConfig]):
             
             identifier = serial_port.replace("/", "_").replace("\\", "_")
         
+        connection_types = ("TCP", "Telnet") if connection_type == "Auto" else (connection_type,)
+        validator = ConnectionValidator(host, port, serial_port)
+        
         try:
-            await self._test_connection(connection_type, host, port, serial_port)
+            result = await validator.validate(connection_types)
+        except TimeoutError as err:
+            _LOG.error("Connection test timed out: %s", err)
+            return SetupError(error_type=IntegrationSetupError.TIMEOUT)
         except Exception as err:
             _LOG.error("Connection test failed: %s", err)
             return SetupError(error_type=IntegrationSetupError.CONNECTION_REFUSED)
         
+        connection_type = result.connection_type
+        _LOG.info(
+            "Connection test successful for %s (model: %s, source: %s)",
+            connection_type, result.model, result.source
+        )
+        store_validated_client(identifier, result.client)
+        
         return NADDeviceConfig(
             identifier=identifier,
-            name=name or f"NAD {connection_type}",
+            name=name or f"NAD {result.model or connection_type}",
             connection_type=connection_type,
             host=host if connection_type in ("TCP", "Telnet") else None,
             port=port,
@@ -55,45 +70,9 @@ class NADSetupFlow(BaseSetupFlow[NADDeviceConfig]):
             max_volume=-20,
             volume_step=4,
             sources=None,
+            command_profile=None if command_profile == "auto" else command_profile,
         )
     
-    async def _test_connection(
-        self, 
-        connection_type: str, 
-        host: str, 
-        port: int, 
-        serial_port: str
-    ) -> None:
-        """Test connection to NAD device."""
-        import asyncio
-        from nad_receiver import NADReceiverTCP, NADReceiverTelnet, NADReceiver
-        
-        try:
-            if connection_type == "TCP":
-                client = NADReceiverTCP(host)
-                # Just verify we can communicate - don't validate the response format
-                await asyncio.to_thread(client.status)
-                _LOG.info("TCP connection test successful - receiver responded")
-                
-            elif connection_type == "Telnet":
-                client = NADReceiverTelnet(host, port)
-                # Just verify we can send command and get response - any response is valid
-                response = await asyncio.to_thread(client.main_power, "?")
-                _LOG.info("Telnet connection test successful - receiver responded with: %s", response)
-                
-            else:  # RS232
-                client = NADReceiver(serial_port)
-                # Just verify we can send command and get response
-                response = await asyncio.to_thread(client.main_power, "?")
-                _LOG.info("RS232 connection test successful - receiver responded with: %s", response)
-            
-            # If we got here without exception, connection works!
-            _LOG.info("Connection test successful for %s", connection_type)
-            
-        except Exception as err:
-            _LOG.error("Connection test failed: %s", err)
-            raise
-    
     def get_manual_entry_form(self) -> RequestUserInput:
         """Define manual entry fields."""
         return RequestUserInput(
@@ -113,6 +92,7 @@ class NADSetupFlow(BaseSetupFlow[NADDeviceConfig]):
                             "items": [
                                 {"id": "TCP", "label": {"en": "TCP (Digital Amplifiers)"}},
                                 {"id": "Telnet", "label": {"en": "Telnet"}},
+                                {"id": "Auto", "label": {"en": "Not sure (try TCP and Telnet)"}},
                                 {"id": "RS232", "label": {"en": "RS-232 Serial"}},
                             ],
                         }
@@ -133,6 +113,21 @@ class NADSetupFlow(BaseSetupFlow[NADDeviceConfig]):
                     "label": {"en": "Serial Port (RS232)"},
                     "field": {"text": {"value": "/dev/ttyUSB0"}},
                 },
+                {
+                    "id": "command_profile",
+                    "label": {"en": "Command Speed"},
+                    "field": {
+                        "dropdown": {
+                            "value": "auto",
+                            "items": [
+                                {"id": "auto", "label": {"en": "Automatic (by connection type)"}},
+                                {"id": "digital", "label": {"en": "Fast (D/M Series)"}},
+                                {"id": "network", "label": {"en": "Normal (Network Receivers)"}},
+                                {"id": "classic", "label": {"en": "Slow (Older Firmware)"}},
+                            ],
+                        }
+                    },
+                },
             ]
         )
     
@@ -0,0 +1,30 @@
+"""
+NAD AV device state record for Unfolded Circle integration.
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+from typing import Any
+
+
+class NADState:
+    """Compact per-device state record."""
+
+    __slots__ = ("power", "volume", "muted", "source")
+
+    def __init__(self):
+        """Initialize NAD state."""
+        self.power = False
+        self.volume = 0
+        self.muted = False
+        self.source: str | None = None
+
+    def payload(self) -> dict[str, Any]:
+        """Return a DeviceEvents.UPDATE payload snapshot of the current state."""
+        return {
+            "state": "ON" if self.power else "OFF",
+            "volume": self.volume,
+            "muted": self.muted,
+            "source": self.source,
+        }
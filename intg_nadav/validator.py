@@ -0,0 +1,181 @@
+"""
+NAD AV connection validation for Unfolded Circle integration.
+
+:copyright: (c) 2025 by Meir Miyara.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+_LOG = logging.getLogger(__name__)
+
+VALIDATION_TIMEOUT = 5.0
+CLIENT_MAX_AGE = 120.0
+
+_validated_clients: dict[str, tuple[Any, asyncio.TimerHandle]] = {}
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of a successful connection probe."""
+
+    connection_type: str
+    client: Any
+    model: str | None = None
+    source: str | int | None = None
+
+
+def close_client(client: Any) -> None:
+    """Close the connection held by a nad_receiver client, if it keeps one open."""
+    transport = getattr(client, "transport", None)
+    try:
+        if hasattr(transport, "nad_telnet"):
+            transport.nad_telnet.close_connection()
+        elif hasattr(transport, "ser"):
+            transport.ser.close()
+    except Exception as err:
+        _LOG.debug("Error closing validated client: %s", err)
+
+
+def store_validated_client(identifier: str, client: Any) -> None:
+    """Keep a validated client so the new device can reuse its connection."""
+    _discard_validated_client(identifier)
+    timer = asyncio.get_running_loop().call_later(
+        CLIENT_MAX_AGE, _discard_validated_client, identifier
+    )
+    _validated_clients[identifier] = (client, timer)
+
+
+def take_validated_client(identifier: str) -> Any | None:
+    """Return and forget the validated client for a device, if still held."""
+    entry = _validated_clients.pop(identifier, None)
+    if entry is None:
+        return None
+
+    client, timer = entry
+    timer.cancel()
+    return client
+
+
+def _discard_validated_client(identifier: str) -> None:
+    """Close and forget a validated client that was not picked up in time."""
+    client = take_validated_client(identifier)
+    if client is not None:
+        _LOG.debug("Closing unused validated connection for %s", identifier)
+        close_client(client)
+
+
+def _close_late_probe(task: asyncio.Task) -> None:
+    """Close the client of a probe that finished after the result was chosen."""
+    if task.cancelled() or task.exception() is not None:
+        return
+    close_client(task.result().client)
+
+
+class ConnectionValidator:
+    """
+    Probe one or more NAD connection types concurrently under a deadline.
+
+    The deadline bounds how long setup waits for an answer. Probes run in
+    worker threads that cannot be interrupted, so a probe still running at
+    the deadline finishes within nad_receiver's own socket timeouts in the
+    background; any connection it opens is closed when it completes.
+    """
+
+    def __init__(
+        self,
+        host: str | None,
+        port: int,
+        serial_port: str,
+        timeout: float = VALIDATION_TIMEOUT,
+    ):
+        """Initialize connection validator."""
+        self._host = host
+        self._port = port
+        self._serial_port = serial_port
+        self._timeout = timeout
+
+    async def validate(self, connection_types: Iterable[str]) -> ProbeResult:
+        """
+        Return the first connection type that answers.
+
+        Raises TimeoutError if nothing answers before the deadline and
+        ConnectionError if every probe failed. Clients opened by the other
+        probes are closed.
+        """
+        tasks = {
+            asyncio.create_task(asyncio.to_thread(self._probe, connection_type))
+            for connection_type in connection_types
+        }
+        deadline = time.monotonic() + self._timeout
+        errors: list[str] = []
+        winner: ProbeResult | None = None
+
+        try:
+            while tasks and winner is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                done, tasks = await asyncio.wait(
+                    tasks, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        errors.append(str(task.exception()))
+                    elif winner is None:
+                        winner = task.result()
+                    else:
+                        close_client(task.result().client)
+        finally:
+            for task in tasks:
+                task.add_done_callback(_close_late_probe)
+
+        if winner is not None:
+            return winner
+        if errors and not tasks:
+            raise ConnectionError("; ".join(errors))
+        raise TimeoutError(f"No response within {self._timeout:.0f}s")
+
+    def _probe(self, connection_type: str) -> ProbeResult:
+        """Open a client and query the receiver (runs in a worker thread)."""
+        from nad_receiver import NADReceiverTCP, NADReceiverTelnet, NADReceiver
+
+        if connection_type == "TCP":
+            client = NADReceiverTCP(self._host)
+            status = client.status()
+            if not status:
+                raise ConnectionError(f"No TCP response from {self._host}")
+            _LOG.info("TCP probe successful - receiver responded: %s", status)
+            return ProbeResult(
+                connection_type="TCP",
+                client=client,
+                source=status.get("source"),
+            )
+
+        if connection_type == "Telnet":
+            client = NADReceiverTelnet(self._host, self._port)
+        else:
+            client = NADReceiver(self._serial_port)
+
+        power = client.main_power("?")
+        if not power:
+            close_client(client)
+            raise ConnectionError(f"No {connection_type} response from receiver")
+
+        model = client.main_model("?")
+        source = client.main_source("?") if power == "On" else None
+        _LOG.info(
+            "%s probe successful - model: %s, power: %s, source: %s",
+            connection_type, model, power, source
+        )
+        return ProbeResult(
+            connection_type=connection_type,
+            client=client,
+            model=model or None,
+            source=source,
+        )